@@ -7,6 +7,11 @@ try:
     import h5py
 except(ImportError):
     pass
+try:
+    # registers the LZ4 (and other) HDF5 compression filters
+    import hdf5plugin
+except(ImportError):
+    pass
 try:
     from sedpy.observate import load_filters
 except(ImportError):
@@ -47,6 +52,10 @@ def results_from(filename, model_file=None, dangerous=True, **kwargs):
         reconstitute the model object.  This executes code in the stored
         paramfile text during import, and is therefore dangerous.
 
+    :param mmap_chain: (optional, default: False)
+        If True, memory-map the sampling arrays instead of reading them into
+        memory.  See :py:func:`read_hdf5`.
+
     :returns results:
         A dictionary of various results including:
           + `"chain"`  - Samples from the posterior probability (ndarray).
@@ -135,7 +144,7 @@ def emcee_restarter(restart_from="", niter=32, **kwargs):
     return obs, model, sps, noise, run_params
 
 
-def read_hdf5(filename, **extras):
+def read_hdf5(filename, mmap_chain=False, **extras):
     """Read an HDF5 file (with a specific format) into a dictionary of results.
 
     This HDF5 file is assumed to have the groups ``sampling`` and ``obs`` which
@@ -149,6 +158,13 @@ def read_hdf5(filename, **extras):
 
     :param filename:
         Name of the HDF5 file.
+
+    :param mmap_chain: (optional, default: False)
+        If True, the arrays in the ``sampling`` group (e.g. ``"chain"`` and
+        ``"lnprobability"``) are returned as read-only ``np.memmap`` views of
+        the file wherever the dataset is stored contiguously, so that only the
+        slices that are actually accessed are read from disk.  Chunked or
+        compressed datasets are read into memory as usual.
     """
     groups = {"sampling": {},
               "bestfit": {},
@@ -161,8 +177,9 @@ def read_hdf5(filename, **extras):
             if group not in hf:
                 continue
             # read the arrays in that group into the dictionary for that group
+            mmap = bool(mmap_chain) & (group == "sampling")
             for k, v in hf[group].items():
-                d[k] = np.array(v)
+                d[k] = read_dataset(v, mmap=mmap)
             # unserialize the attributes and put them in the dictionary
             for k, v in hf[group].attrs.items():
                 try:
@@ -196,6 +213,28 @@ def read_hdf5(filename, **extras):
     return res, obs
 
 
+def read_dataset(dset, mmap=False):
+    """Read an HDF5 dataset into a numpy array, optionally as a memory map.
+
+    :param dset:
+        An ``h5py.Dataset`` instance.
+
+    :param mmap: (optional, default: False)
+        If True and the dataset is stored as a single contiguous block in the
+        file (i.e. it is not chunked or compressed), return a read-only
+        ``np.memmap`` of the data instead of reading it into memory.
+
+    :returns arr:
+        ndarray (or ``np.memmap``) of the dataset values.
+    """
+    if mmap and (dset.ndim > 0) and (dset.chunks is None):
+        offset = dset.id.get_offset()
+        if offset is not None:
+            return np.memmap(dset.file.filename, mode="r", dtype=dset.dtype,
+                             shape=dset.shape, offset=offset)
+    return np.array(dset)
+
+
 def obs_from_h5(obsgroup):
     from ..observation import from_serial
     observations = []
@@ -314,7 +353,8 @@ def traceplot(results, showpars=None, start=0, chains=slice(None),
 
     :param **plot_kwargs:
         Extra keywords are passed to the
-        ``matplotlib.axes._subplots.AxesSubplot.plot()`` method.
+        ``matplotlib.collections.LineCollection`` holding the walker traces of
+        each panel, e.g. ``linewidth``, ``alpha``, or ``color``.
 
     :returns tracefig:
         A multipaneled Figure object that shows the evolution of walker
@@ -344,7 +384,6 @@ def traceplot(results, showpars=None, start=0, chains=slice(None),
     wghts = results.get('weights', None)
     if wghts is not None:
         wghts = wghts[start:]
-    nwalk = trace.shape[0]
 
     # Set up plot windows
     ndim = len(parnames) + 1
@@ -368,16 +407,15 @@ def traceplot(results, showpars=None, start=0, chains=slice(None),
     #fig.subplots_adjust(left=lb[1], bottom=lb[0], right=tr[1], top=tr[0],
     #                    wspace=whspace, hspace=whspace)
 
-    # Sequentially plot the chains in each parameter
+    # Sequentially plot the chains in each parameter, with all the walkers of
+    # a panel drawn as a single LineCollection artist
     for i in range(ndim - 1):
         ax = axes.flat[i]
-        for j in range(nwalk):
-            ax.plot(trace[j, :, i], **plot_kwargs)
+        add_traces(ax, trace[:, :, i], **plot_kwargs)
         ax.set_title(parnames[i], y=1.02)
     # Plot lnprob
     ax = axes.flat[-1]
-    for j in range(nwalk):
-        ax.plot(lnp[j, :], **plot_kwargs)
+    add_traces(ax, lnp, **plot_kwargs)
     ax.set_title('lnP', y=1.02)
 
     [ax.set_xlabel("iteration") for ax in axes[-1, :]]
@@ -391,6 +429,48 @@ def traceplot(results, showpars=None, start=0, chains=slice(None),
     return fig
 
 
+def add_traces(ax, traces, **line_kwargs):
+    """Add the traces of several walkers to an axis as a single
+    ``LineCollection``, which is much faster to build and draw than one
+    ``Line2D`` artist per walker.
+
+    :param ax:
+        The matplotlib Axes instance to draw the traces on.
+
+    :param traces:
+        ndarray of shape ``(nwalkers, niter)`` giving the value of a quantity
+        for each walker at each iteration.
+
+    :param **line_kwargs:
+        Extra keywords are passed to ``LineCollection``.  If no color is
+        given, walkers cycle through the colors of the axes property cycle, as
+        they would with ``ax.plot()``.
+
+    :returns lc:
+        The ``LineCollection`` that was added to ``ax``.
+    """
+    import matplotlib.pyplot as pl
+    from matplotlib.collections import LineCollection
+
+    traces = np.atleast_2d(traces)
+    nwalk, niter = traces.shape
+    segs = np.empty((nwalk, niter, 2))
+    segs[..., 0] = np.arange(niter)
+    segs[..., 1] = traces
+
+    kwargs = dict(line_kwargs)
+    if not any(k in kwargs for k in ["color", "colors", "c"]):
+        cycle = pl.rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+        kwargs["colors"] = [cycle[j % len(cycle)] for j in range(nwalk)]
+    elif "c" in kwargs:
+        kwargs["color"] = kwargs.pop("c")
+
+    lc = LineCollection(segs, **kwargs)
+    ax.add_collection(lc)
+    ax.autoscale_view()
+    return lc
+
+
 def subcorner(results, showpars=None, truths=None,
               start=0, thin=1, chains=slice(None),
               logify=["mass", "tau"], **kwargs):
@@ -450,10 +530,11 @@ def subcorner(results, showpars=None, truths=None,
     wghts = results.get('weights', None)
     if wghts is not None:
         wghts = wghts[start::thin]
-    samples = trace.reshape(trace.shape[0] * trace.shape[1], trace.shape[2])
+    samples = trace.reshape(-1, trace.shape[-1])
 
-    # logify some parameters
-    xx = samples.copy()
+    # logify some parameters, only copying the samples if we have to
+    logify = [p for p in logify if p in parnames]
+    xx = samples.copy() if len(logify) > 0 else samples
     if truths is not None:
         xx_truth = np.array(truths).copy()
     else:
@@ -5,6 +5,7 @@
 to HDF5 files as well as to pickles.
 """
 
+import os
 import warnings
 import pickle, json
 import numpy as np
@@ -16,6 +17,12 @@ try:
 except(ImportError):
     _has_h5py_ = False
 
+try:
+    import hdf5plugin
+    _has_hdf5plugin_ = True
+except(ImportError):
+    _has_hdf5plugin_ = False
+
 __all__ = ["githash", "write_hdf5",
            "chain_to_struct"]
 
@@ -41,23 +48,62 @@ class NumpyEncoder(json.JSONEncoder):
 
 
 def pick(obj):
-    """create a serialized object that can go into hdf5 in py2 and py3, and can be read by both
+    """create a serialized object that can go into hdf5 as an opaque
+    attribute.  The highest (binary) pickle protocol is used so that any numpy
+    arrays in ``obj`` are written as raw buffers instead of being escaped into
+    the ASCII protocol 0 stream.
+    """
+    return np.void(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _git_rev(path):
+    """Get the commit hash of the git checkout at ``path`` by reading
+    ``.git/HEAD`` and resolving the ref it points to (in a loose ref file or
+    in ``packed-refs``) directly, without forking a git process.
+
+    :param path:
+        The top level directory of the git working tree.
+
+    :returns rev:
+        The hash of the checked out commit as a string, or ``None`` if it could
+        not be determined (e.g. for an installed package).
     """
-    return np.void(pickle.dumps(obj, 0))
+    gitdir = os.path.join(path, ".git")
+    try:
+        with open(os.path.join(gitdir, "HEAD"), "r") as f:
+            head = f.read().strip()
+        if not head.startswith("ref:"):
+            # detached HEAD
+            return head
+        ref = head[4:].strip()
+        try:
+            with open(os.path.join(gitdir, ref), "r") as f:
+                return f.read().strip()
+        except(IOError, OSError):
+            with open(os.path.join(gitdir, "packed-refs"), "r") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    rev, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return rev
+    except(IOError, OSError):
+        pass
+    return None
 
 
 def githash(**extras):
     """Pull out the git hash history for Prospector here.
     """
+    path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __githash__ = _git_rev(path)
     try:
-        from .._version import __version__#, __githash__
-        __githash__ = None
-        bgh = __version__, __githash__
+        from .._version import __version__
     except(ImportError):
         warnings.warn("Could not obtain prospector version info", RuntimeWarning)
-        bgh = "Can't get version number."
+        __version__ = "Can't get version number."
 
-    return bgh
+    return __version__, __githash__
 
 
 def paramfile_string(param_file=None, **extras):
@@ -78,6 +124,7 @@ def write_hdf5(hfile,
                optimize_result_tuple=None,
                write_model_params=True,
                sps=None,
+               compression=None,
                **extras):
     """Write output and information to an HDF5 file object (or
     group).
@@ -107,6 +154,11 @@ def write_hdf5(hfile,
     sps : instance of :py:class:`prospect.sources.SSPBasis` (optional, default: None)
         If a `prospect.sources.SSPBasis` object is supplied, it will be used to
         generate and store best fit values (not implemented)
+
+    compression : string (optional, default: None)
+        Compression filter to apply to the sampling arrays, e.g. ``"lz4"``,
+        ``"lzf"``, or ``"gzip"``.  See :py:func:`compression_kwargs`.  Note
+        that compressed datasets cannot be memory-mapped when reading.
     """
     # If ``hfile`` is not a file object, assume it is a filename and open
     if isinstance(hfile, str):
@@ -125,7 +177,7 @@ def write_hdf5(hfile,
         chain, extras = nested_to_struct(sampling_result, model)
     else:
         chain, extras = None, None
-    write_sampling_h5(hf, chain, extras)
+    write_sampling_h5(hf, chain, extras, compression=compression)
     hf.flush()
 
     # ----------------------
@@ -182,16 +234,23 @@ def metadata(run_params, model, write_model_params=True):
         from copy import deepcopy
         meta["model_params"] = deepcopy(model.params)
     for k, v in list(meta.items()):
-        try:
-            meta[k] = json.dumps(v, cls=NumpyEncoder)
-        except(TypeError):
-            meta[k] = pick(v)
-        except:
-            meta[k] = unserial
+        meta[k] = serialize(v)
 
     return meta
 
 
+def serialize(obj):
+    """Serialize an object for storage as an HDF5 attribute, as JSON if
+    possible and otherwise as a pickle.
+    """
+    try:
+        return json.dumps(obj, cls=NumpyEncoder)
+    except(TypeError):
+        return pick(obj)
+    except:
+        return unserial
+
+
 def emcee_to_struct(sampler, model):
     # preamble
     samples = sampler.get_chain(flat=True)
@@ -224,23 +283,59 @@ def nested_to_struct(nested_out, model):
     return chaincat, extras
 
 
-def write_sampling_h5(hf, chain, extras):
+def compression_kwargs(compression=None, shuffle=True):
+    """Translate the name of a compression filter into keyword arguments for
+    ``h5py.Group.create_dataset``.  LZ4 is fast enough that compressing the
+    chain costs little on write or read; it requires the ``hdf5plugin``
+    package, and falls back to the builtin (and similarly fast) LZF filter if
+    that is not installed.
+
+    :param compression: (optional, default: None)
+        Name of the filter, e.g. ``"lz4"``, ``"lzf"``, or ``"gzip"``.  If
+        ``None``, no compression is applied.
+
+    :param shuffle: (optional, default: True)
+        If compressing, also apply the HDF5 byte shuffle filter before
+        compression.  This groups the bytes of each element by significance,
+        so that the slowly varying exponent and high mantissa bytes of
+        floating point samples compress much better.
+
+    :returns kwargs:
+        Dictionary of keyword arguments for ``create_dataset``.
+    """
+    if compression is None:
+        return {}
+    if compression == "lz4":
+        if _has_hdf5plugin_:
+            ckw = dict(hdf5plugin.LZ4())
+            ckw["shuffle"] = shuffle
+            return ckw
+        warnings.warn("hdf5plugin is required for lz4 compression, using lzf",
+                      RuntimeWarning)
+        compression = "lzf"
+    return dict(compression=compression, shuffle=shuffle)
+
+
+def write_sampling_h5(hf, chain, extras, compression=None):
     try:
         sdat = hf['sampling']
     except(KeyError):
         sdat = hf.create_group('sampling')
 
-    sdat.create_dataset('chain', data=chain)
+    ckw = compression_kwargs(compression)
+    sdat.create_dataset('chain', data=chain, **ckw)
     try:
         uchain = structured_to_unstructured(chain)
-        sdat.create_dataset("unstructured_chain", data=uchain)
+        sdat.create_dataset("unstructured_chain", data=uchain, **ckw)
     except:
         pass
+    # numeric arrays are stored natively as (optionally compressed) datasets,
+    # everything else is serialized into the attributes of the group
     for k, v in extras.items():
-        try:
-            sdat.create_dataset(k, data=v)
-        except:
-            sdat.attrs[k] = v
+        if isinstance(v, np.ndarray) and (v.ndim > 0) and (v.dtype != object):
+            sdat.create_dataset(k, data=v, **ckw)
+        else:
+            sdat.attrs[k] = serialize(v)
 
 
 def write_obs_to_h5(hf, obslist):
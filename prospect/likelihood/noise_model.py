@@ -87,9 +87,9 @@ class NoiseModel:
         """Simple ln-likihood for diagonal covariance matrix.
         """
         delta = data - pred
-        lnp = -0.5*(np.dot(delta**2, np.log(2*np.pi) / self.Sigma) +
-                    self.log_det)
-        return lnp.sum()
+        lnp = -0.5*(np.dot(delta**2, 1.0 / self.Sigma) + self.log_det +
+                    len(delta) * np.log(2*np.pi))
+        return lnp
 
 
 class NoiseModel1D(NoiseModel):
@@ -164,10 +164,19 @@ class NoiseModelCov(NoiseModel1D):
             self.Sigma += kernel(metric[mask], weights=wght[mask], ndim=ndmax)
         return self.Sigma
 
-    def compute(self, check_finite=False, **vectors):
+    def compute(self, check_finite=False, force=False, **vectors):
         """Build and cache the covariance matrix, and if it is 2-d factorize it
         and cache that.  Also cache ``log_det``.
+
+        If neither the kernel parameters nor the vectors (metric, mask, and
+        weights) have changed since the last call, the cached covariance and
+        its factorization are reused, unless ``force`` is True.
         """
+        state = self._compute_state(**vectors)
+        if (not force) and self._same_state(state):
+            return
+        self._last_state = state
+
         self.Sigma = self.construct_covariance(**vectors)
         if self.Sigma.ndim == 1:
             self.log_det = np.sum(np.log(self.Sigma))
@@ -176,6 +185,23 @@ class NoiseModelCov(NoiseModel1D):
             self.log_det = 2 * np.sum(np.log(np.diag(self.factorized_Sigma[0])))
             assert np.isfinite(self.log_det)
 
+    def _compute_state(self, **vectors):
+        """Collect copies of the inputs that determine the covariance matrix:
+        the current kernel parameter values, and the contents of the vectors
+        used as the metric, mask, and weights.  Copies are kept so that
+        in-place changes to these inputs are noticed.
+        """
+        pars = [k.params[p] for k in self.kernels for p in k.kernel_params]
+        names = [self.metric_name, self.mask_name] + [k.weight_by for k in self.kernels]
+        vecs = [vectors.get(n, None) for n in names]
+        return [np.array(v, copy=True) for v in pars + vecs]
+
+    def _same_state(self, state):
+        last = getattr(self, "_last_state", None)
+        if (last is None) or (len(last) != len(state)):
+            return False
+        return all(np.array_equal(v, lv) for v, lv in zip(state, last))
+
     def lnlikelihood(self, prediction, data, check_finite=False):
         """Compute the ln of the likelihood, using the current cached (and
         factorized if non-diagonal) covariance matrix.
@@ -93,6 +93,7 @@ class ProspectorParams(object):
             :py:attr:`config_dict`
         """
         self._has_parameter_dependencies = False
+        self._dependencies = []
         if (not hasattr(self, 'params')) or reset:
             self.params = {}
 
@@ -110,6 +111,7 @@ class ProspectorParams(object):
             if info.get('depends_on', None) is not None:
                 assert callable(info["depends_on"])
                 self._has_parameter_dependencies = True
+                self._dependencies.append((par, info["depends_on"]))
         # propogate user supplied values to the params state, overriding the
         # configure `init` values
         for k, v in list(kwargs.items()):
@@ -136,6 +138,9 @@ class ProspectorParams(object):
                 msg = "{} has wrong length prior, should be {}"
                 warnings.warn(msg.format(p, n), RuntimeWarning)
         self.ndim = count
+        # cache the (name, slice) pairs for the likelihood hot path
+        self._theta_items = list(self.theta_index.items())
+        self._theta_labels = None
 
     def set_parameters(self, theta):
         """Propagate theta into the model parameters :py:attr:`params` dictionary.
@@ -145,8 +150,9 @@ class ProspectorParams(object):
             of shape ``(ndim,)``
         """
         assert len(theta) == self.ndim
-        for k, inds in list(self.theta_index.items()):
-            self.params[k] = np.atleast_1d(theta[inds]).copy()
+        theta = np.asarray(theta)
+        for k, inds in self._theta_items:
+            self.params[k] = theta[inds].copy()
         self.propagate_parameter_dependencies()
 
     def prior_product(self, theta, nested=False, **extras):
@@ -185,7 +191,7 @@ class ProspectorParams(object):
         """
         lnp_prior = 0
 
-        for k, inds in list(self.theta_index.items()):
+        for k, inds in self._theta_items:
             func = self.config_dict[k]['prior']
             this_prior = np.sum(func(theta[..., inds]), axis=-1)
             lnp_prior += this_prior
@@ -204,7 +210,7 @@ class ProspectorParams(object):
         """
         theta = np.zeros(len(unit_coords))
 
-        for k, inds in list(self.theta_index.items()):
+        for k, inds in self._theta_items:
 
             func = self.config_dict[k]['prior'].unit_transform
             theta[inds] = func(unit_coords[inds])
@@ -218,10 +224,9 @@ class ProspectorParams(object):
         """
         if self._has_parameter_dependencies == False:
             return
-        for p, info in list(self.config_dict.items()):
-            if 'depends_on' in info:
-                value = info['depends_on'](**self.params)
-                self.params[p] = np.atleast_1d(value)
+        for p, func in self._dependencies:
+            value = func(**self.params)
+            self.params[p] = np.atleast_1d(value)
 
     def rectify_theta(self, theta, epsilon=1e-10):
         """Replace zeros in a given theta vector with a small number epsilon.
@@ -236,7 +241,7 @@ class ProspectorParams(object):
         state dictionary.
         """
         theta = np.zeros(self.ndim)
-        for k, inds in list(self.theta_index.items()):
+        for k, inds in self._theta_items:
             theta[inds] = self.params[k]
         return theta
 
@@ -271,6 +276,10 @@ class ProspectorParams(object):
             A list of labels of the same length and order as the theta
             vector.
         """
+        # the default labels only depend on theta_index, so are cached
+        if (not name_map) and (self._theta_labels is not None):
+            return list(self._theta_labels)
+
         label, index = [], []
         for p, inds in list(self.theta_index.items()):
             nt = inds.stop - inds.start
@@ -285,7 +294,10 @@ class ProspectorParams(object):
                 for i in range(nt):
                     label.append(name+'_{0}'.format(i+1))
                     index.append(inds.start+i)
-        return [l for (i, l) in sorted(zip(index, label))]
+        labels = [l for (i, l) in sorted(zip(index, label))]
+        if not name_map:
+            self._theta_labels = list(labels)
+        return labels
 
     def theta_bounds(self):
         """Get the bounds on each parameter from the prior.
@@ -204,7 +204,7 @@ class SpecModel(ProspectorParams):
 
         # --- add fixed lines if necessary ---
         emask = self._fix_eline_pixelmask
-        if emask.any() & (~continuum_only):
+        if emask.any() & (not continuum_only):
             inds = self._fix_eline & self._valid_eline
             espec = self.predict_eline_spec(line_indices=inds,
                                             wave=self._outwave[emask])
@@ -213,7 +213,7 @@ class SpecModel(ProspectorParams):
 
         # --- add (previously) fitted lines if necessary ---
         emask = self._fit_eline_pixelmask
-        if emask.any() (~continuum_only):
+        if emask.any() & (not continuum_only):
             inst_spec[emask] += self._fit_eline_spec.sum(axis=1)
 
         return inst_spec
@@ -489,22 +489,21 @@ class SpecModel(ProspectorParams):
             self.line_norm = self.flux_norm() / (1 + self._zred) * (3631*jansky_cgs)
             elums = self._eline_lum[self._use_eline] * self.line_norm
 
-        # loop over filters
-        flux = np.zeros(len(filterset))
         try:
             # TODO: Since in this case filters are on a grid, there should be a
-            # faster way to look up the transmission than the later loop
+            # faster way to look up the transmission than interpolating each
+            # filter at the line wavelengths
             flist = filterset.filters
         except(AttributeError):
             flist = filterset
-        for i, filt in enumerate(flist):
-            # calculate transmission at line wavelengths
-            trans = np.interp(elams, filt.wavelength, filt.transmission,
-                              left=0., right=0.)
-            # include all lines where transmission is non-zero
-            idx = (trans > 0)
-            if True in idx:
-                flux[i] = (trans[idx]*elams[idx]*elums[idx]).sum() / filt.ab_zero_counts
+
+        # transmission of each filter at the line wavelengths, (nfilt, nline)
+        # lines outside a filter have zero transmission and so contribute nothing
+        trans = np.array([np.interp(elams, filt.wavelength, filt.transmission,
+                                    left=0., right=0.)
+                          for filt in flist])
+        zero_counts = np.array([filt.ab_zero_counts for filt in flist])
+        flux = np.dot(trans, elams * elums) / zero_counts
 
         return flux
 
@@ -660,19 +659,25 @@ class SpecModel(ProspectorParams):
         alpha_breve = self._eline_lum[idx] * linecal
 
         # FIXME: nebopt: be careful with inverses
-        # generate inverse of sigma_spec
+        # apply inverse of sigma_spec to the line profiles and residuals
         if sigma_spec is None:
             sigma_spec = obs["unc"]**2
         sigma_spec = sigma_spec[emask]
         if sigma_spec.ndim == 2:
             sigma_inv = np.linalg.pinv(sigma_spec)
+            sigma_inv_gaussians = np.dot(sigma_inv, eline_gaussians)
+            sigma_inv_delta = np.dot(sigma_inv, delta)
         else:
-            sigma_inv = np.diag(1. / sigma_spec)
+            # diagonal; weight by inverse variance instead of building the
+            # dense (n_wave_neb, n_wave_neb) inverse matrix
+            ivar = 1. / sigma_spec
+            sigma_inv_gaussians = ivar[:, None] * eline_gaussians
+            sigma_inv_delta = ivar * delta
 
         # Calculate ML emission line amplitudes and covariance matrix
         # FIXME: nebopt: do this with a solve
-        sigma_alpha_hat = np.linalg.pinv(np.dot(eline_gaussians.T, np.dot(sigma_inv, eline_gaussians)))
-        alpha_hat = np.dot(sigma_alpha_hat, np.dot(eline_gaussians.T, np.dot(sigma_inv, delta)))
+        sigma_alpha_hat = np.linalg.pinv(np.dot(eline_gaussians.T, sigma_inv_gaussians))
+        alpha_hat = np.dot(sigma_alpha_hat, np.dot(eline_gaussians.T, sigma_inv_delta))
 
         # Generate likelihood penalty term (and MAP amplitudes)
 
@@ -756,17 +761,9 @@ class SpecModel(ProspectorParams):
             warr = wave
 
         # generate gaussians
-        mu = np.atleast_2d(self._ewave_obs[lineidx])
-        sigma = np.atleast_2d(self._eline_sigma_kms[lineidx])
-        dv = ckms * (warr[:, None]/mu - 1)
-        dv_dnu = ckms * warr[:, None]**2 / (lightspeed * mu)
-
-        eline_gaussians = 1. / (sigma * np.sqrt(np.pi * 2)) * np.exp(-dv**2 / (2 * sigma**2))
-        eline_gaussians *= dv_dnu
-
-        # outside of the wavelengths defined by the spectrum? (why this dependence?)
-        # FIXME what is this?
-        eline_gaussians /= -np.trapz(eline_gaussians, 3e18/warr[:, None], axis=0)
+        mu = np.atleast_1d(self._ewave_obs[lineidx])
+        sigma = np.atleast_1d(self._eline_sigma_kms[lineidx])
+        eline_gaussians = unit_line_profiles(warr, mu, sigma)
 
         return eline_gaussians
 
@@ -1034,9 +1031,7 @@ class AGNSpecModel(SpecModel):
         # generate photometry w/o emission lines
         obs_wave = self.observed_wave(self._wave, do_wavecal=False)
         flambda = self._norm_spec * lightspeed / obs_wave**2 * (3631*jansky_cgs)
-        phot = 10**(-0.4 * np.atleast_1d(getSED(obs_wave, flambda, filters)))
-        # TODO: below is faster for sedpy > 0.2.0
-        #phot = np.atleast_1d(getSED(obs_wave, flambda, filters, linear_flux=True))
+        phot = np.atleast_1d(getSED(obs_wave, flambda, filters, linear_flux=True))
 
         # generate emission-line photometry
         if (self._want_lines & self._need_lines):
@@ -1062,7 +1057,8 @@ class AGNSpecModel(SpecModel):
 
         anorm = self.params.get('agn_elum', 1.0) * self.flux_norm() / (1 + self._zred)
         alums = self._aline_lum[line_indices] * anorm
-        aline_spec = (alums * gaussians).sum(axis=1)
+        # (n_wave, n_line) x (n_line,) matvec, without an (n_wave, n_line) temporary
+        aline_spec = np.dot(gaussians, alums)
         return aline_spec
 
 
@@ -1143,6 +1139,50 @@ def ln_mvn(x, mean=None, cov=None):
     return -0.5 * (ndim * log_2pi + log_det + exp)
 
 
+def unit_line_profiles(wave, mu, sigma):
+    r"""Compute gaussian line profiles in velocity, expressed as flux densities
+    per unit frequency and normalized to unit integral over the frequencies
+    corresponding to ``wave``.  This is the numerical core of
+    :py:meth:`SpecModel.get_eline_gaussians`, evaluated at every likelihood
+    call when lines are added to a spectrum.
+
+    Constant factors for each line (the gaussian normalization and the
+    :math:`1/\mu` of :math:`dv/d\nu`) cancel in the normalization, so only
+    :math:`\lambda^2 \exp(-dv^2/2\sigma^2)` is computed, in place.
+
+    :param wave:
+        Wavelengths (AA) at which to evaluate the profiles, ndarray of shape
+        ``(n_wave,)``
+
+    :param mu:
+        Observed frame line centers (AA), ndarray of shape ``(n_line,)``
+
+    :param sigma:
+        Line widths in km/s, ndarray of shape ``(n_line,)``
+
+    :returns profiles:
+        ndarray of shape ``(n_wave, n_line)``
+    """
+    w = wave[:, None]
+    profiles = w / mu
+    profiles -= 1
+    profiles *= ckms / sigma
+    profiles **= 2
+    profiles *= -0.5
+    np.exp(profiles, out=profiles)
+    profiles *= w**2
+
+    # outside of the wavelengths defined by the spectrum? (why this dependence?)
+    # FIXME what is this?
+    # trapezoidal integral over frequency, as a single matrix-vector product.
+    # frequency decreases with wavelength, hence the sign.
+    dnu = np.diff(3e18 / wave)
+    norm = -0.5 * np.dot(dnu, profiles[1:] + profiles[:-1])
+    profiles /= norm
+
+    return profiles
+
+
 def gauss(x, mu, A, sigma):
     """Sample multiple gaussians at positions x.
 
@@ -275,6 +275,7 @@ class Photometry(Observation):
             self.filters = filters
             self.filternames = []
             self.filterset = None
+            self._wavelength = np.zeros(0)
             return
 
         try:
@@ -289,14 +290,18 @@ class Photometry(Observation):
         self.filterset = FilterSet(self.filternames)
         # filters on the gridded resolution
         self.filters = [f for f in self.filterset.filters]
+        # the effective wavelengths are needed for every likelihood call, so
+        # cache them here rather than rebuilding from the filters each time
+        self._wavelength = np.fromiter((f.wave_effective for f in self.filters),
+                                       dtype=float, count=len(self.filters))
 
     @property
     def wavelength(self):
-        return np.array([f.wave_effective for f in self.filters])
+        return self._wavelength
 
     def to_oldstyle(self):
         obs = super(Photometry, self).to_oldstyle()
-        obs["phot_wave"] = self.wavelength
+        obs["phot_wave"] = obs.pop("_wavelength")
         return obs
 
 
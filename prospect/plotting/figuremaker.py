@@ -125,25 +125,23 @@ class FigureMaker(object):
         :param full: bool, optional
             If true, generate the intrinsic spextrum (`sed_*`) over the entire wavelength
             range.  The (restframe) wavelength vector will be given by
-            `self.sps.wavelengths`
+            `self.sps.wavelengths`.  Note that this intrinsic spectrum is the
+            continuum only, without the emission lines that are added when
+            predicting observed spectra.
         """
         if self.sps is None:
             self.build_sps()
 
-        # --- best sample ---
-        xbest = self.result["chain"][self.ind_best, :]
-        blob = self.model.predict(xbest, obs=self.obs, sps=self.sps)
-        self.spec_best, self.phot_best, self.mfrac_best = blob
-        self.cal_best = self.model._speccal.copy()
         if full:
-            from copy import deepcopy
-            dummy = deepcopy(self.obs)
-            dummy["wavelength"] = None
-            dummy["spectrum"] = None
-            s, p, _ = self.model.predict(xbest, obs=dummy, sps=self.sps)
+            from ..observation import IntrinsicSpectrum
+            dummy = IntrinsicSpectrum(wavelength=None, name="intrinsic")
         else:
             dummy = None
-        self.sed_best = self.model._sed.copy()
+
+        # --- best sample ---
+        xbest = self.result["chain"][self.ind_best, :]
+        blob = self.predict_sample(xbest, dummy=dummy)
+        self.spec_best, self.phot_best, self.sed_best, self.cal_best, self.mfrac_best = blob
 
         # --- get SED samples ---
         if self.n_seds > 0:
@@ -155,6 +153,46 @@ class FigureMaker(object):
             self.sed_samples = np.atleast_2d(self.sed_best)
             self.cal_samples = np.atleast_2d(self.cal_best)
 
+    def predict_sample(self, x, dummy=None):
+        """Generate the spectrum, photometry, intrinsic SED, and calibration
+        vector for a single parameter vector.  The SPS model is only computed
+        once; the intrinsic SED for ``dummy`` is predicted from the cached
+        model state instead of with a second call to ``model.predict``.
+
+        :param x: ndarray of shape (ndim,)
+            The parameter vector.
+
+        :param dummy: Observation instance, optional
+            If given, use this observation (usually an
+            :py:class:`prospect.observation.IntrinsicSpectrum` with no
+            wavelength array) to generate the intrinsic SED vector.  For an
+            ``IntrinsicSpectrum`` this is the continuum only, without
+            emission lines.
+
+        :returns spec, phot, sed, cal, mfrac:
+            The predictions for the first spectroscopic and photometric
+            observations, the intrinsic SED and calibration vector for that
+            same spectrum (or the SED for ``dummy`` if given), and the
+            surviving mass fraction.  Any of these that are not available are
+            ``None``.
+        """
+        # this mirrors model.predict(), but captures the calibration and
+        # intrinsic SED of the first spectrum before later spectra overwrite
+        # them.
+        self.model.predict_init(x, self.sps)
+        spec = phot = sed = cal = None
+        for obs in self.obs:
+            pred = self.model.predict_obs(obs)
+            if (obs.kind == "spectrum") & (spec is None):
+                spec = pred
+                cal = np.copy(self.model._speccal)
+                sed = np.copy(self.model._sed)
+            elif (obs.kind == "photometry") & (phot is None):
+                phot = pred
+        if dummy is not None:
+            sed = self.model.predict_obs(dummy)
+        return spec, phot, sed, cal, self.model._mfrac
+
     def draw_seds(self, n_seds, dummy=None):
         """Draw a number of samples from the posterior chain, and generate
         spectra and photometry for them.
@@ -162,23 +200,21 @@ class FigureMaker(object):
         :param n_seds: int
             Number of samples to draw and generate SEDs for
 
-        :param dummy: dict, optional
-            If given, use this dictionary as the obs dictionary when generating the intrinsic SED vector.
-            Useful for generating an SED over a large wavelength range
+        :param dummy: Observation instance, optional
+            If given, use this observation when generating the intrinsic SED
+            vector.  Useful for generating an SED over a large wavelength range
         """
         if self.sps is None:
-            self.sps = self.build_sps()
+            self.build_sps()
         raw_samples = sample_posterior(self.result["chain"], self.weights, nsample=n_seds)
         spec, phot, cal, sed, mfrac = [], [], [], [], []
         for x in raw_samples:
-            s, p, m = self.model.predict(x, obs=self.obs, sps=self.sps)
+            s, p, d, c, m = self.predict_sample(x, dummy=dummy)
             spec.append(s)
             phot.append(p)
+            sed.append(d)
+            cal.append(c)
             mfrac.append(m)
-            cal.append(self.model._speccal.copy())
-            if dummy is not None:
-                s, p, _ = self.model.predict(x, obs=dummy, sps=self.sps)
-            sed.append(self.model._sed)
 
         # should make this a named tuple
         return np.array(spec), np.array(phot), np.array(sed), np.array(cal)
@@ -197,15 +197,17 @@ def hist_samples(res, showpars=None, start=0, thin=1,
     :param thin: (optional, default: 10.0)
        Only use every ``thin`` iteration when calculating percentiles.
     """
-    parnames = np.array(res.get('theta_labels', res['model'].theta_labels()))
+    try:
+        parnames = np.array(res['theta_labels'])
+    except(KeyError):
+        parnames = np.array(res['model'].theta_labels())
     niter = res['chain'].shape[-2]
     start_index = np.floor(start * (niter-1)).astype(int)
     if res["chain"].ndim > 2:
         # emcee
         flatchain = res['chain'][:, start_index::thin, :]
-        dims = flatchain.shape
-        flatchain = flatchain.reshape(dims[0]*dims[1], dims[2])
-        flatlnprob = res['lnprobability'][:, start_index::thin].reshape(dims[0]*dims[1])
+        flatchain = flatchain.reshape(-1, flatchain.shape[-1])
+        flatlnprob = res['lnprobability'][:, start_index::thin].reshape(-1)
     elif res["chain"].ndim == 2:
         # dynesty
         flatchain = res["chain"][start_index::thin, :]
@@ -197,8 +197,8 @@ if __name__ == "__main__":
     if rp.get("output_pickles", False):
         # Write the dynesty result object as a pickle
         import pickle
-        with open(outroot + '_dns.pkl', 'w') as f:
-            pickle.dump(dynestyout, f)
+        with open(outroot + '_dns.pkl', 'wb', buffering=16*1024*1024) as f:
+            pickle.dump(dynestyout, f, protocol=pickle.HIGHEST_PROTOCOL)
     
         # Write the model as a pickle
         partext = write_results.paramfile_string(**rp)
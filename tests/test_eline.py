@@ -191,3 +191,67 @@ def test_eline_implementation(get_sps, plot=False):
     # test marginalizing over lines
     #model_pars["marginalize_elines"] = dict(init=True)
     #model = SpecModel(model_pars)
+
+
+def test_unit_line_profiles():
+    from prospect.models.sedmodel import unit_line_profiles
+    from prospect.sources.constants import ckms, lightspeed
+
+    wave = np.linspace(4800, 5100, 2000)
+    mu = np.array([4862.7, 4960.3, 5008.2])
+    sigma = np.array([50., 100., 300.])
+    profiles = unit_line_profiles(wave, mu, sigma)
+
+    # direct evaluation of normalized gaussians in velocity, per unit frequency
+    dv = ckms * (wave[:, None] / mu - 1)
+    dv_dnu = ckms * wave[:, None]**2 / (lightspeed * mu)
+    expected = np.exp(-dv**2 / (2 * sigma**2)) / (sigma * np.sqrt(2 * np.pi)) * dv_dnu
+    nu = 3e18 / wave[:, None]
+    norm = 0.5 * np.sum((expected[1:] + expected[:-1]) * np.diff(nu, axis=0), axis=0)
+    expected /= -norm
+
+    assert profiles.shape == (len(wave), len(mu))
+    assert np.allclose(profiles, expected, rtol=1e-10, atol=1e-12 * expected.max())
+
+
+class LineSPS:
+    """A stand-in for an SPS object with a flat continuum and emission
+    lines with the wavelengths listed in ``emline_info``.
+    """
+
+    def __init__(self, emline_info):
+        self.wavelengths = np.linspace(900, 25000, 5000)
+        self.emline_info = emline_info
+
+    def get_galaxy_spectrum(self, **params):
+        return self.wavelengths.copy(), np.ones_like(self.wavelengths) * 1e-10, 0.6
+
+    def get_galaxy_elines(self):
+        ewave = self.emline_info["wave"]
+        return ewave, np.ones_like(ewave) * 1e-8
+
+
+def test_predict_intrinsic():
+    from prospect.observation import IntrinsicSpectrum
+
+    model_pars = TemplateLibrary["parametric_sfh"]
+    model_pars.update(TemplateLibrary["nebular"])
+    model_pars["nebemlineinspec"]["init"] = False
+    model = SpecModel(model_pars)
+    sps = LineSPS(model.emline_info)
+
+    wave = np.linspace(4000, 6000, 2000)
+    dummy = IntrinsicSpectrum(wavelength=wave, flux=np.ones_like(wave),
+                              uncertainty=np.ones_like(wave), name="intrinsic")
+    dummy.rectify()
+
+    model.predict_init(model.theta, sps=sps)
+    continuum = model.predict_intrinsic(dummy, continuum_only=True)
+    withlines = model.predict_intrinsic(dummy, continuum_only=False)
+    assert continuum.shape == wave.shape
+    # the fixed lines are only added when asked for
+    assert model._fix_eline_pixelmask.any()
+    assert np.all(withlines >= continuum)
+    assert np.any(withlines > continuum)
+    assert np.allclose(withlines[~model._fix_eline_pixelmask],
+                       continuum[~model._fix_eline_pixelmask])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from prospect.models import SpecModel, templates
+from prospect.observation import Photometry, Spectrum, IntrinsicSpectrum
+from prospect.plotting.figuremaker import FigureMaker
+
+
+class StubSPS:
+    """A minimal stand-in for an SPS object, with a smooth spectrum and no
+    emission lines.
+    """
+
+    wavelengths = np.logspace(3, 4.5, 3000)
+
+    def get_galaxy_spectrum(self, **params):
+        spec = 1e-10 * (self.wavelengths / 5000.)**2
+        return self.wavelengths.copy(), spec, 0.6
+
+    def get_galaxy_elines(self):
+        return np.zeros(0), np.zeros(0)
+
+
+def build_figuremaker(observations):
+    fm = FigureMaker()
+    fm.model = SpecModel(templates.TemplateLibrary["parametric_sfh"])
+    fm.obs = observations
+    fm.sps = StubSPS()
+    return fm
+
+
+def build_obs():
+    fnames = list([f"sdss_{b}0" for b in "ugriz"])
+    Nf = len(fnames)
+    phot = Photometry(filters=fnames, flux=np.ones(Nf), uncertainty=np.ones(Nf)/10)
+    specs = []
+    for i, (wlo, whi, n) in enumerate([(4000, 5000, 500), (6000, 7000, 300)]):
+        specs.append(Spectrum(wavelength=np.linspace(wlo, whi, n),
+                              flux=np.ones(n), uncertainty=np.ones(n) / 10,
+                              response=np.ones(n) * (i + 2)))
+    obslist = specs + [phot]
+    [obs.rectify() for obs in obslist]
+    return obslist
+
+
+def test_predict_sample():
+    obslist = build_obs()
+    fm = build_figuremaker(obslist)
+    x = fm.model.theta.copy()
+
+    spec, phot, sed, cal, mfrac = fm.predict_sample(x)
+    preds, mfrac_direct = fm.model.predict(x, observations=obslist, sps=fm.sps)
+    assert np.allclose(spec, preds[0])
+    assert np.allclose(phot, preds[2])
+    assert mfrac == mfrac_direct
+    # calibration and intrinsic SED belong to the first spectrum
+    assert np.allclose(cal, obslist[0].response)
+    assert np.allclose(sed * cal, spec)
+
+    # photometry only
+    fm.obs = obslist[-1:]
+    spec, phot, sed, cal, mfrac = fm.predict_sample(x)
+    assert (spec is None) & (sed is None) & (cal is None)
+    assert len(phot) == len(obslist[-1].filters)
+
+    # intrinsic SED over the whole model wavelength range
+    dummy = IntrinsicSpectrum(wavelength=None, name="intrinsic")
+    spec, phot, sed, cal, mfrac = fm.predict_sample(x, dummy=dummy)
+    assert sed.shape == fm.sps.wavelengths.shape
+    assert np.all(np.isfinite(sed))
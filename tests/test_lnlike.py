@@ -88,3 +88,81 @@ def test_lnlike_shape(get_sps):
     # %timeit predictions, x = model.predict(theta + np.random.uniform(-0.1, 0.1) * arr, observations=observations, sps=sps)
     # %timeit lnp_data = [compute_lnlike(pred, obs, vectors={}) for pred, obs in zip(predictions, observations)]
     # %timeit lnp = lnprobfn(theta + np.random.uniform(0, 3) * arr, model=model, observations=observations, sps=sps)
+
+
+def test_noise_cov_cache():
+    from prospect.likelihood import NoiseModelCov
+    from prospect.likelihood.kernels import Uncorrelated, PhotoCal
+
+    fnames = np.array([f"sdss_{b}0" for b in "ugriz"])
+    Nf = len(fnames)
+    vectors = dict(filternames=fnames, uncertainty=np.ones(Nf)/10,
+                   mask=np.ones(Nf, dtype=bool))
+
+    jitter = Uncorrelated(parnames=["unc_factor"], weight_by="uncertainty")
+    photcal = PhotoCal(parnames=["phot_cal_amp", "phot_cal_bands"],
+                       weight_by="uncertainty")
+    noise = NoiseModelCov(metric_name="filternames", kernels=[jitter, photcal],
+                          weight_by=["uncertainty", "uncertainty"])
+    params = dict(unc_factor=np.array([1.0]), phot_cal_amp=np.array([0.5]),
+                  phot_cal_bands=np.array(["sdss_g0", "sdss_r0"]))
+
+    # string valued kernel parameters
+    noise.update(**params)
+    noise.compute(**vectors)
+    factor, log_det = noise.factorized_Sigma, noise.log_det
+    assert np.isfinite(log_det)
+
+    # cache hit
+    noise.update(**params)
+    noise.compute(**vectors)
+    assert noise.factorized_Sigma is factor
+
+    # cache miss when a kernel parameter changes
+    params["phot_cal_amp"] = np.array([0.8])
+    noise.update(**params)
+    noise.compute(**vectors)
+    assert noise.factorized_Sigma is not factor
+    assert noise.log_det != log_det
+    params["phot_cal_bands"] = np.array(["sdss_g0"])
+    noise.update(**params)
+    log_det = noise.log_det
+    noise.compute(**vectors)
+    assert noise.log_det != log_det
+
+    # cache miss when the uncertainties are changed in place
+    log_det = noise.log_det
+    vectors["uncertainty"] *= 2
+    noise.compute(**vectors)
+    assert np.isclose(noise.log_det, log_det + 2 * Nf * np.log(2))
+
+    # forced recomputation gives the same answer as a fresh noise model
+    noise.compute(force=True, **vectors)
+    fresh = NoiseModelCov(metric_name="filternames", kernels=[jitter, photcal],
+                          weight_by=["uncertainty", "uncertainty"])
+    fresh.compute(**vectors)
+    assert np.isclose(fresh.log_det, noise.log_det)
+
+
+def test_diagonal_lnlikelihood():
+    unc = np.array([0.1, 0.2, 0.5, 1.0])
+    flux = np.array([1.0, 2.0, 3.0, 4.0])
+    pred = np.array([1.1, 1.8, 3.0, 5.0])
+    spec = Spectrum(wavelength=np.linspace(4000, 5000, 4), flux=flux,
+                    uncertainty=unc, mask=np.array([True, True, True, False]))
+    spec.noise = NoiseModel()
+    spec.rectify()
+
+    # hand-computed gaussian ln-likelihood of the unmasked points:
+    # chi^2 = 1 + 1 + 0, sum(ln(2 pi sigma^2)) = 3 ln(2 pi) + ln(0.01 * 0.04 * 0.25)
+    chi2 = 2.0
+    lnnorm = 3 * np.log(2 * np.pi) + np.log(1e-4)
+    expected = -0.5 * (chi2 + lnnorm)
+    lnp = spec.noise.lnlike(pred, spec)
+    assert np.isclose(lnp, expected)
+
+    # changing the uncertainties in place is picked up
+    spec.uncertainty *= 2
+    lnp = spec.noise.lnlike(pred, spec)
+    expected = -0.5 * (chi2 / 4 + lnnorm + 3 * np.log(4))
+    assert np.isclose(lnp, expected)
@@ -9,8 +9,8 @@ import h5py
 from prospect.models import SpecModel, templates
 from prospect.sources import CSPSpecBasis
 from prospect.observation import Photometry, Spectrum
-from prospect.io.write_results import write_obs_to_h5
-from prospect.io.read_results import obs_from_h5
+from prospect.io.write_results import write_obs_to_h5, write_sampling_h5, chain_to_struct
+from prospect.io.read_results import obs_from_h5, read_hdf5
 
 
 @pytest.fixture(scope="module")
@@ -65,4 +65,100 @@ def test_observation_io(build_sps, plot=False):
 
     # cleanup?
     import os
-    os.remove(fn)
\ No newline at end of file
+    os.remove(fn)
+
+
+def test_sampling_mmap():
+    model = build_model()
+    chain = np.random.uniform(size=(64, model.ndim))
+    struct = chain_to_struct(chain, model=model)
+    extras = dict(lnprobability=np.random.uniform(size=64))
+
+    r = np.random.randint(0, 10000) #HAAACK
+    fn = f"./test-{r}.h5"
+    with h5py.File(fn, "w") as hf:
+        write_sampling_h5(hf, struct, extras)
+
+    res, _ = read_hdf5(fn, mmap_chain=True)
+    assert isinstance(res["chain"], np.memmap)
+    assert np.allclose(res["unstructured_chain"], chain)
+    assert np.allclose(res["lnprobability"], extras["lnprobability"])
+
+    import os
+    del res
+    os.remove(fn)
+
+
+def test_sampling_roundtrip():
+    model = build_model()
+    chain = np.random.uniform(size=(64, model.ndim))
+    struct = chain_to_struct(chain, model=model)
+    extras = dict(weights=None,
+                  lnprobability=np.random.uniform(size=64),
+                  rstate=("MT19937", 12, 0.5),
+                  duration=1.5)
+
+    r = np.random.randint(0, 10000) #HAAACK
+    fn = f"./test-{r}.h5"
+    with h5py.File(fn, "w") as hf:
+        write_sampling_h5(hf, struct, extras, compression="lzf")
+    with h5py.File(fn, "r") as hf:
+        assert hf["sampling/chain"].compression == "lzf"
+        assert hf["sampling/lnprobability"].compression == "lzf"
+        assert hf["sampling/chain"].shuffle
+        assert hf["sampling/lnprobability"].shuffle
+
+    # compressed datasets are read into memory even if mmap is requested
+    res, _ = read_hdf5(fn, mmap_chain=True)
+    assert not isinstance(res["chain"], np.memmap)
+    assert np.allclose(res["unstructured_chain"], chain)
+    assert np.allclose(res["lnprobability"], extras["lnprobability"])
+    assert res["weights"] is None
+    assert res["rstate"] == list(extras["rstate"])
+    assert res["duration"] == extras["duration"]
+
+    import os
+    os.remove(fn)
+
+
+def test_git_rev(tmp_path):
+    from prospect.io.write_results import _git_rev
+
+    gitdir = tmp_path / ".git"
+    (gitdir / "refs" / "heads").mkdir(parents=True)
+    # loose ref
+    (gitdir / "HEAD").write_text("ref: refs/heads/main\n")
+    (gitdir / "refs" / "heads" / "main").write_text("abc123\n")
+    assert _git_rev(str(tmp_path)) == "abc123"
+
+    # packed ref
+    (gitdir / "HEAD").write_text("ref: refs/heads/dev\n")
+    (gitdir / "packed-refs").write_text("# pack-refs with: peeled\n"
+                                        "def456 refs/heads/dev\n"
+                                        "^fff000\n")
+    assert _git_rev(str(tmp_path)) == "def456"
+
+    # detached HEAD
+    (gitdir / "HEAD").write_text("0123abcd\n")
+    assert _git_rev(str(tmp_path)) == "0123abcd"
+
+    # not a git checkout
+    assert _git_rev(str(tmp_path / "nothing")) is None
+
+
+def test_compression_kwargs():
+    from prospect.io.write_results import compression_kwargs
+
+    assert compression_kwargs(None) == {}
+    assert compression_kwargs("lzf") == dict(compression="lzf", shuffle=True)
+    assert compression_kwargs("lzf", shuffle=False) == dict(compression="lzf", shuffle=False)
+
+    r = np.random.randint(0, 10000) #HAAACK
+    fn = f"./test-{r}.h5"
+    with h5py.File(fn, "w") as hf:
+        hf.create_dataset("x", data=np.arange(100.), **compression_kwargs("lzf", shuffle=False))
+        assert hf["x"].compression == "lzf"
+        assert not hf["x"].shuffle
+
+    import os
+    os.remove(fn)